@@ -15,6 +15,7 @@
 
 import os
 import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
@@ -129,9 +130,43 @@ def capitalized_input_graph(
     return graph
 
 
+@lru_cache(maxsize=None)
+def _compile_string_file(rel_path: str) -> 'pynini.FstLike':
+    return pynini.string_file(get_abs_path(rel_path)).optimize()
+
+
+def load_string_file(rel_path: str) -> 'pynini.FstLike':
+    """
+    Loads tsv file as optimized string_file graph. The file is compiled only once per process and shared
+    across grammars, a copy is returned so that callers can modify the graph in place.
+
+    Args:
+        rel_path: tsv file path relative to the en package, e.g. "data/number/digit.tsv"
+
+    Returns string_file graph
+    """
+    return _compile_string_file(rel_path).copy()
+
+
+def minimize_encoded(fst: 'pynini.FstLike') -> 'pynini.FstLike':
+    """
+    Determinizes and minimizes a weighted transducer as an acceptor over encoded (input, output, weight) labels.
+    Unlike optimize(), it does not rely on known fst properties to decide whether to determinize.
+
+    Args:
+        fst: input fst, it is not modified
+
+    Returns minimized fst, arc-sorted on input labels
+    """
+    encoder = pynini.EncodeMapper(fst.arc_type(), encode_labels=True, encode_weights=True)
+    fst = pynini.determinize(fst.copy().rmepsilon().encode(encoder))
+    return fst.minimize().decode(encoder).arcsort(sort_type="ilabel")
+
+
 def generator_main(file_name: str, graphs: Dict[str, 'pynini.FstLike']):
     """
     Exports graph as OpenFst finite state archive (FAR) file with given file name and rule name.
+    Graphs are optimized and arc-sorted on input labels, so loaded graphs can be composed without sorting a copy.
 
     Args:
         file_name: exported file name
@@ -139,7 +174,7 @@ def generator_main(file_name: str, graphs: Dict[str, 'pynini.FstLike']):
     """
     exporter = export.Exporter(file_name)
     for rule, graph in graphs.items():
-        exporter[rule] = graph.optimize()
+        exporter[rule] = graph.optimize().arcsort(sort_type="ilabel")
     exporter.close()
     logger.info(f'Created {file_name}')
 
@@ -23,6 +23,7 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     NEMO_SIGMA,
     GraphFst,
     insert_space,
+    load_string_file,
 )
 from nemo_text_processing.text_normalization.en.taggers.date import get_four_digit_year_graph
 from nemo_text_processing.text_normalization.en.utils import get_abs_path
@@ -50,8 +51,8 @@ class CardinalFst(GraphFst):
             pynini.closure(NEMO_DIGIT, 2, 3) | pynini.difference(NEMO_DIGIT, pynini.accep("0"))
         ) @ graph
 
-        graph_digit = pynini.string_file(get_abs_path("data/number/digit.tsv"))
-        graph_zero = pynini.string_file(get_abs_path("data/number/zero.tsv"))
+        graph_digit = load_string_file("data/number/digit.tsv")
+        graph_zero = load_string_file("data/number/zero.tsv")
 
         single_digits_graph = pynini.invert(graph_digit | graph_zero)
         self.single_digits_graph = single_digits_graph + pynini.closure(insert_space + single_digits_graph)
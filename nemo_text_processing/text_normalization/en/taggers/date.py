@@ -26,6 +26,7 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     delete_extra_space,
     delete_space,
     insert_space,
+    load_string_file,
 )
 from nemo_text_processing.text_normalization.en.utils import (
     augment_labels_with_punct_at_end,
@@ -33,9 +34,9 @@ from nemo_text_processing.text_normalization.en.utils import (
     load_labels,
 )
 
-graph_teen = pynini.invert(pynini.string_file(get_abs_path("data/number/teen.tsv"))).optimize()
-graph_digit = pynini.invert(pynini.string_file(get_abs_path("data/number/digit.tsv"))).optimize()
-ties_graph = pynini.invert(pynini.string_file(get_abs_path("data/number/ty.tsv"))).optimize()
+graph_teen = pynini.invert(load_string_file("data/number/teen.tsv")).optimize()
+graph_digit = pynini.invert(load_string_file("data/number/digit.tsv")).optimize()
+ties_graph = pynini.invert(load_string_file("data/number/ty.tsv")).optimize()
 year_suffix = load_labels(get_abs_path("data/date/year_suffix.tsv"))
 year_suffix.extend(augment_labels_with_punct_at_end(year_suffix))
 year_suffix = pynini.string_map(year_suffix).optimize()
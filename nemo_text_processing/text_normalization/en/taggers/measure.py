@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import pynini
 from pynini.examples import plurals
 from pynini.lib import pynutil
@@ -29,12 +31,19 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     convert_space,
     delete_space,
     delete_zero_or_one_space,
+    generator_main,
     insert_space,
+    load_string_file,
+    minimize_encoded,
 )
 from nemo_text_processing.text_normalization.en.taggers.ordinal import OrdinalFst as OrdinalTagger
 from nemo_text_processing.text_normalization.en.taggers.whitelist import get_formats
 from nemo_text_processing.text_normalization.en.utils import get_abs_path, load_labels
 from nemo_text_processing.text_normalization.en.verbalizers.ordinal import OrdinalFst as OrdinalVerbalizer
+from nemo_text_processing.utils.logging import logger
+
+# flattened address graphs keyed by the (deterministic, lm) flags of the cardinal graph they were built from
+_ADDRESS_GRAPH_CACHE = {}
 
 
 class MeasureFst(GraphFst):
@@ -50,15 +59,50 @@ class MeasureFst(GraphFst):
         fraction: FractionFst
         deterministic: if True will provide a single transduction option,
             for False multiple transduction are generated (used for audio-based normalization)
+        cache_dir: path to a dir with .far grammar file. Set to None to avoid using cache.
+        overwrite_cache: set to True to overwrite .far files
     """
 
-    def __init__(self, cardinal: GraphFst, decimal: GraphFst, fraction: GraphFst, deterministic: bool = True):
+    def __init__(
+        self,
+        cardinal: GraphFst,
+        decimal: GraphFst,
+        fraction: GraphFst,
+        deterministic: bool = True,
+        cache_dir: str = None,
+        overwrite_cache: bool = False,
+    ):
         super().__init__(name="measure", kind="classify", deterministic=deterministic)
+
+        far_file = None
+        if cache_dir is not None and cache_dir != "None":
+            os.makedirs(cache_dir, exist_ok=True)
+            far_file = os.path.join(cache_dir, f"en_tn_{deterministic}_deterministic_{cardinal.lm}_lm_measure.far")
+        if not overwrite_cache and far_file and os.path.exists(far_file):
+            self.fst = pynini.Far(far_file, mode="r")["measure"]
+            logger.info(f'MeasureFst.fst was restored from {far_file}.')
+        else:
+            self.fst = self.get_measure_graph(cardinal=cardinal, decimal=decimal, fraction=fraction)
+
+            if far_file:
+                generator_main(far_file, {"measure": self.fst})
+
+    def get_measure_graph(self, cardinal: GraphFst, decimal: GraphFst, fraction: GraphFst):
+        """
+        Returns measure graph wrapped in measure tokens
+
+        Args:
+            cardinal: CardinalFst
+            decimal: DecimalFst
+            fraction: FractionFst
+        """
         cardinal_graph = cardinal.graph_with_and | self.get_range(cardinal.graph_with_and)
+        # minimize once as the cardinal graph is reused in the cardinal and math sub-graphs below
+        cardinal_graph = minimize_encoded(cardinal_graph)
 
-        graph_unit = pynini.string_file(get_abs_path("data/measure/unit.tsv"))
-        if not deterministic:
-            graph_unit |= pynini.string_file(get_abs_path("data/measure/unit_alternatives.tsv"))
+        graph_unit = load_string_file("data/measure/unit.tsv")
+        if not self.deterministic:
+            graph_unit |= load_string_file("data/measure/unit_alternatives.tsv")
 
         graph_unit |= pynini.compose(
             pynini.closure(TO_LOWER, 1) + (NEMO_ALPHA | TO_LOWER) + pynini.closure(NEMO_ALPHA | TO_LOWER), graph_unit
@@ -175,7 +219,7 @@ class MeasureFst(GraphFst):
             + pynutil.insert("\" } preserve_order: true")
         )
 
-        math_operations = pynini.string_file(get_abs_path("data/measure/math_operation.tsv"))
+        math_operations = load_string_file("data/measure/math_operation.tsv")
         delimiter = pynini.accep(" ") | pynutil.insert(" ")
 
         math = (
@@ -207,20 +251,21 @@ class MeasureFst(GraphFst):
             + math
             + pynutil.insert("\" } preserve_order: true")
         )
-        final_graph = (
-            subgraph_decimal
-            | subgraph_cardinal
-            | unit_graph
-            | decimal_dash_alpha
-            | decimal_times
-            | alpha_dash_decimal
-            | subgraph_fraction
-            | address
-            | math
+        # a single n-ary union avoids building an intermediate fst for every pairwise `|`
+        final_graph = pynini.union(
+            subgraph_decimal,
+            subgraph_cardinal,
+            unit_graph,
+            decimal_dash_alpha,
+            decimal_times,
+            alpha_dash_decimal,
+            subgraph_fraction,
+            address,
+            math,
         )
 
         final_graph = self.add_tokens(final_graph)
-        self.fst = final_graph.optimize()
+        return minimize_encoded(final_graph)
 
     def get_range(self, cardinal: GraphFst):
         """
@@ -238,7 +283,7 @@ class MeasureFst(GraphFst):
 
         for x in ["*", " * "]:
             range_graph |= cardinal + pynini.cross(x, " times ") + cardinal
-        return range_graph.optimize()
+        return range_graph
 
     def get_address_graph(self, cardinal):
         """
@@ -248,12 +293,21 @@ class MeasureFst(GraphFst):
                 units: "address" cardinal
                 { integer: "two seven eight eight San Tomas Expressway Santa Clara California nine five zero five one" }
                  preserve_order: true
+
+        The graph is flattened into a single minimized fst and cached per cardinal configuration,
+        a copy is returned so that callers can modify the graph in place.
         """
-        ordinal_verbalizer = OrdinalVerbalizer().graph
+        key = (cardinal.deterministic, cardinal.lm)
+        if key not in _ADDRESS_GRAPH_CACHE:
+            _ADDRESS_GRAPH_CACHE[key] = minimize_encoded(self._get_address_graph(cardinal))
+        return _ADDRESS_GRAPH_CACHE[key].copy()
+
+    def _get_address_graph(self, cardinal):
+        # compose the ordinal tagger directly with the verbalizer suffix rewrite (21st -> twenty one -> twenty first),
+        # this avoids building the `integer: "..."` wrapper that the verbalizer deletes again
+        ordinal_suffix = OrdinalVerbalizer().suffix
         ordinal_tagger = OrdinalTagger(cardinal=cardinal).graph
-        ordinal_num = pynini.compose(
-            pynutil.insert("integer: \"") + ordinal_tagger + pynutil.insert("\""), ordinal_verbalizer
-        )
+        ordinal_num = pynini.compose(ordinal_tagger, ordinal_suffix)
 
         address_num = NEMO_DIGIT ** (1, 2) @ cardinal.graph_hundred_component_at_least_one_none_zero_digit
         address_num += insert_space + NEMO_DIGIT ** 2 @ (
@@ -23,6 +23,7 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     delete_extra_space,
     delete_space,
     insert_space,
+    load_string_file,
     plurals,
 )
 from nemo_text_processing.text_normalization.en.utils import get_abs_path
@@ -49,7 +50,7 @@ class TelephoneFst(GraphFst):
         zero = pynini.cross("0", "zero")
         if not deterministic:
             zero |= pynini.cross("0", pynini.union("o", "oh"))
-        digit = pynini.invert(pynini.string_file(get_abs_path("data/number/digit.tsv"))).optimize() | zero
+        digit = pynini.invert(load_string_file("data/number/digit.tsv")).optimize() | zero
 
         telephone_prompts = pynini.string_file(get_abs_path("data/telephone/telephone_prompt.tsv"))
         country_code = (
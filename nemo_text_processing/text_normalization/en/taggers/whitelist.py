@@ -25,6 +25,7 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     SINGULAR_TO_PLURAL,
     GraphFst,
     convert_space,
+    load_string_file,
 )
 from nemo_text_processing.text_normalization.en.taggers.roman import get_names
 from nemo_text_processing.text_normalization.en.utils import (
@@ -97,8 +98,8 @@ class WhiteListFst(GraphFst):
             multiple_forms_whitelist_graph = get_formats(get_abs_path("data/whitelist/alternatives_all_format.tsv"))
             graph |= multiple_forms_whitelist_graph
 
-            graph_unit = pynini.string_file(get_abs_path("data/measure/unit.tsv")) | pynini.string_file(
-                get_abs_path("data/measure/unit_alternatives.tsv")
+            graph_unit = load_string_file("data/measure/unit.tsv") | load_string_file(
+                "data/measure/unit_alternatives.tsv"
             )
             graph_unit_plural = graph_unit @ SINGULAR_TO_PLURAL
             units_graph = pynini.compose(NEMO_CHAR ** (3, ...), convert_space(graph_unit | graph_unit_plural))
@@ -29,6 +29,7 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     delete_extra_space,
     delete_space,
     insert_space,
+    load_string_file,
 )
 from nemo_text_processing.text_normalization.en.utils import get_abs_path
 
@@ -45,7 +46,7 @@ class ElectronicFst(GraphFst):
 
     def __init__(self, deterministic: bool = True):
         super().__init__(name="electronic", kind="verbalize", deterministic=deterministic)
-        graph_digit_no_zero = pynini.invert(pynini.string_file(get_abs_path("data/number/digit.tsv"))).optimize()
+        graph_digit_no_zero = pynini.invert(load_string_file("data/number/digit.tsv")).optimize()
         graph_zero = pynini.cross("0", "zero")
         long_numbers = pynutil.add_weight(graph_digit_no_zero + pynini.cross("000", " thousand"), MIN_NEG_WEIGHT)
 
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import os
+from functools import lru_cache
+from typing import Tuple
 
 import pynini
 from pynini.lib import pynutil
@@ -24,11 +26,20 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     NEMO_SIGMA,
     NEMO_SPACE,
     generator_main,
+    minimize_encoded,
 )
 from nemo_text_processing.text_normalization.en.taggers.punctuation import PunctuationFst
 from nemo_text_processing.utils.logging import logger
 
 
+@lru_cache(maxsize=None)
+def _get_punct_marks() -> Tuple[str, ...]:
+    """
+    Returns punctuation marks supported by the punctuation tagger, the tagger is built only once per process.
+    """
+    return tuple(PunctuationFst().punct_marks)
+
+
 class PostProcessingFst:
     """
     Finite state transducer that post-processing an entire sentence after verbalization is complete, e.g.
@@ -104,7 +115,7 @@ class PostProcessingFst:
             {``} quotes are converted to {"}. Note, if there are spaces around single quote {'}, they will be kept.
             By default, a space is added after a punctuation mark, and spaces are removed before punctuation marks.
         """
-        punct_marks_all = PunctuationFst().punct_marks
+        punct_marks_all = _get_punct_marks()
 
         # no_space_before_punct assume no space before them
         quotes = ["'", "\"", "``", "«"]
@@ -135,12 +146,13 @@ class PostProcessingFst:
             + pynini.closure(non_punct)
         )
         graph = pynini.closure(graph).optimize()
-        graph = pynini.compose(
-            graph, pynini.cdrewrite(pynini.cross("``", '"'), "", "", NEMO_SIGMA).optimize()
-        ).optimize()
+        convert_quotes = pynini.cdrewrite(pynini.cross("``", '"'), "", "", NEMO_SIGMA, direction="ltr", mode="obl")
+        graph = pynini.compose(graph, convert_quotes.optimize()).optimize()
 
         # remove space after no_space_after_punct (even if there are no matching closing brackets)
-        no_space_after_punct = pynini.cdrewrite(delete_space, no_space_after_punct, NEMO_SIGMA, NEMO_SIGMA).optimize()
+        no_space_after_punct = pynini.cdrewrite(
+            delete_space, no_space_after_punct, NEMO_SIGMA, NEMO_SIGMA, direction="ltr", mode="obl"
+        ).optimize()
         graph = pynini.compose(graph, no_space_after_punct).optimize()
 
         # remove space around text in quotes
@@ -176,7 +188,10 @@ class PostProcessingFst:
             NEMO_ALPHA,
             pynini.union("s ", "s[EOS]"),
             NEMO_SIGMA,
+            direction="ltr",
+            mode="obl",
         )
 
-        graph = pynini.compose(graph, remove_space_around_single_quote).optimize()
-        return graph
+        graph = pynini.compose(graph, remove_space_around_single_quote)
+        # determinize and minimize once here, the result is cached to .far and loaded as is
+        return minimize_encoded(graph)
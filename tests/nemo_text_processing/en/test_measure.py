@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 
 import pytest
 from parameterized import parameterized
+from pynini.lib.rewrite import top_rewrite
 
 from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+from nemo_text_processing.text_normalization.en.taggers.cardinal import CardinalFst
+from nemo_text_processing.text_normalization.en.taggers.decimal import DecimalFst
+from nemo_text_processing.text_normalization.en.taggers.fraction import FractionFst
+from nemo_text_processing.text_normalization.en.taggers.measure import MeasureFst
 from nemo_text_processing.text_normalization.normalize import Normalizer
 from nemo_text_processing.text_normalization.normalize_with_audio import NormalizerWithAudio
 
@@ -64,3 +70,18 @@ class TestMeasure:
                 test_input, n_tagged=30, punct_post_process=False,
             )
             assert expected in pred_non_deterministic
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_measure_cache(self, tmp_path):
+        cardinal = CardinalFst(deterministic=True)
+        decimal = DecimalFst(cardinal=cardinal, deterministic=True)
+        fraction = FractionFst(cardinal=cardinal, deterministic=True)
+        cache_dir = str(tmp_path)
+
+        built = MeasureFst(cardinal=cardinal, decimal=decimal, fraction=fraction, cache_dir=cache_dir)
+        assert os.path.exists(os.path.join(cache_dir, f"en_tn_True_deterministic_{cardinal.lm}_lm_measure.far"))
+        restored = MeasureFst(cardinal=cardinal, decimal=decimal, fraction=fraction, cache_dir=cache_dir)
+
+        for test_input in ["12kg", "-1.5 km", "2788 San Tomas Expy, Santa Clara, CA 95051", "1 + 2 = 3"]:
+            assert top_rewrite(test_input, restored.fst) == top_rewrite(test_input, built.fst)